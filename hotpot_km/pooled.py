@@ -170,17 +170,21 @@ class PooledKernelManager(LimitedKernelManager):
         # Parent doesn't correctly add all created kernels until they have completed startup:
         pools = self._pools
         self._pools = {}
-        for pool in pools.values():
-            # The iteration gets confused if we don't copy pool
-            for fut in tuple(pool):
-                try:
-                    kid = await fut
-                except Exception as e:
-                    if not isinstance(e, MaximumKernelsException):
-                        self.log.exception("Kernel failed starting up")
-                    continue
-                if kid in self:
-                    await self.shutdown_kernel(kid, *args, **kwargs)
+
+        async def shutdown_pooled(fut):
+            try:
+                kid = await fut
+            except Exception as e:
+                if not isinstance(e, MaximumKernelsException):
+                    self.log.exception("Kernel failed starting up")
+                return
+            if kid in self:
+                await self.shutdown_kernel(kid, *args, **kwargs)
+
+        # Shut down in parallel, so we wait on the slowest instead of the sum:
+        await asyncio.gather(
+            *(shutdown_pooled(fut) for pool in pools.values() for fut in pool)
+        )
         try:
             asyncio.gather(*self._discarded)
         except Exception as e:
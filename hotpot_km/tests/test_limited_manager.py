@@ -1,5 +1,4 @@
 from contextlib import asynccontextmanager
-from subprocess import PIPE
 
 from tornado.testing import gen_test
 from traitlets.config.loader import Config
@@ -12,7 +11,7 @@ try:
 except ImportError:
     pass
 
-from .utils import TestAsyncKernelManager
+from .utils import _QUIET, TEST_TIMEOUT, TestAsyncKernelManager
 
 
 # Test that it works as normal with default config
@@ -47,12 +46,12 @@ class TestLimitedKernelManagerApplied(TestAsyncKernelManager):
         finally:
             await km.shutdown_all()
 
-    @gen_test(timeout=60)
+    @gen_test(timeout=TEST_TIMEOUT)
     async def test_touch_max(self):
         async with self._get_tcp_km() as km:
             kids = []
             for i in range(4):
-                kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+                kid = await km.start_kernel(**_QUIET)
                 self.assertIn(kid, km)
                 kids.append(kid)
 
@@ -61,7 +60,7 @@ class TestLimitedKernelManagerApplied(TestAsyncKernelManager):
             self.assertNotIn(kid, km)
             kids.pop()
 
-            kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            kid = await km.start_kernel(**_QUIET)
             self.assertIn(kid, km)
             kids.append(kid)
 
@@ -69,24 +68,24 @@ class TestLimitedKernelManagerApplied(TestAsyncKernelManager):
             for kid in kids:
                 self.assertNotIn(kid, km)
 
-    @gen_test(timeout=60)
+    @gen_test(timeout=TEST_TIMEOUT)
     async def test_breach_max(self):
         async with self._get_tcp_km() as km:
             kids = []
             for i in range(4):
-                kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+                kid = await km.start_kernel(**_QUIET)
                 self.assertIn(kid, km)
                 kids.append(kid)
 
             with self.assertRaises(MaximumKernelsException):
-                await km.start_kernel(stdout=PIPE, stderr=PIPE)
+                await km.start_kernel(**_QUIET)
 
             # Remove and add one to make sure we correctly recovered
             await km.shutdown_kernel(kid)
             self.assertNotIn(kid, km)
             kids.pop()
 
-            kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            kid = await km.start_kernel(**_QUIET)
             self.assertIn(kid, km)
             kids.append(kid)
 
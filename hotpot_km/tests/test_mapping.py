@@ -1,13 +1,13 @@
 import asyncio
 from contextlib import asynccontextmanager
+import copy
 import platform
-from subprocess import PIPE
 
 
 from jupyter_client.kernelspec import NATIVE_KERNEL_NAME
 from pytest import mark
+from tornado import ioloop
 from traitlets.config.loader import Config
-from tornado.web import HTTPError
 from tornado.testing import gen_test
 
 from .. import MaximumKernelsException
@@ -18,13 +18,31 @@ except ImportError:
     pass
 
 
-from .utils import async_shutdown_all_direct, TestAsyncKernelManager
+from .utils import (
+    _QUIET,
+    START_TIMEOUT,
+    TEST_TIMEOUT,
+    async_shutdown_all_direct,
+    settle_pool,
+    wait_for_cull,
+    TestAsyncKernelManager,
+)
 
 
 CULL_TIMEOUT = 10 if platform.python_implementation() == 'PyPy' else 5
 CULL_INTERVAL = 1
 
 
+# Built once, deep-copied per manager, so per-manager tweaks don't leak:
+_BASE_CONFIG = Config()
+_BASE_CONFIG.LimitedKernelManager.max_kernels = 4
+_BASE_CONFIG.PooledMappingKernelManager.fill_delay = 0
+_BASE_CONFIG.PooledMappingKernelManager.kernel_pools = {NATIVE_KERNEL_NAME: 2}
+_BASE_CONFIG.PooledMappingKernelManager.pool_kwargs = {
+    NATIVE_KERNEL_NAME: dict(_QUIET)
+}
+
+
 # Test that it works as normal with default config
 class TestMappingKernelManagerUnused(TestAsyncKernelManager):
     __test__ = True
@@ -33,8 +51,8 @@ class TestMappingKernelManagerUnused(TestAsyncKernelManager):
     @staticmethod
     @asynccontextmanager
     async def _get_tcp_km():
-        c = Config()
-        km = PooledMappingKernelManager(config=c)
+        # No config overrides apply here, so skip building a Config:
+        km = PooledMappingKernelManager()
         try:
             yield km
         finally:
@@ -51,28 +69,92 @@ class TestMappingKernelManagerUnused(TestAsyncKernelManager):
 class TestMappingKernelManagerApplied(TestAsyncKernelManager):
     __test__ = True
 
-    # static so picklable for multiprocessing on Windows
+    # A single event loop and prewarmed manager shared by all tests in the
+    # class, so the pool startup cost is only paid once:
+    _class_loop = None
+    _shared_km = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._class_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(cls._class_loop)
+        cls._class_io_loop = ioloop.IOLoop.current()
+        cls._shared_km = None
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._shared_km is not None:
+            cls._class_loop.run_until_complete(cls._shared_km.shutdown_all())
+            cls._shared_km = None
+        cls._class_io_loop.close(all_fds=True)
+        cls._class_loop = None
+        asyncio.set_event_loop(None)
+        super().tearDownClass()
+
+    def get_new_ioloop(self):
+        # Reuse the class loop (tornado will not close a main asyncio loop)
+        return self._class_io_loop
+
     @staticmethod
-    @asynccontextmanager
-    async def _get_tcp_km(config_culling=False):
-        c = Config()
-        c.LimitedKernelManager.max_kernels = 4
-        c.PooledMappingKernelManager.fill_delay = 0
-        c.PooledMappingKernelManager.kernel_pools = {NATIVE_KERNEL_NAME: 2}
-        c.PooledMappingKernelManager.pool_kwargs = {
-            NATIVE_KERNEL_NAME: dict(stdout=PIPE, stderr=PIPE)
-        }
+    def _make_km(config_culling=False):
+        c = copy.deepcopy(_BASE_CONFIG)
         if config_culling:
             c.MappingKernelManager.cull_idle_timeout = CULL_TIMEOUT
             c.MappingKernelManager.cull_interval = CULL_INTERVAL
             c.MappingKernelManager.cull_connected = False
 
         km = PooledMappingKernelManager(config=c)
+        # Kick off the pool warmup right away, so that it overlaps with any
+        # further setup; await km.warm_task when the pool is actually needed.
+        km.warm_task = asyncio.ensure_future(km.wait_for_pool())
+        return km
+
+    # classmethod so picklable for multiprocessing on Windows
+    @classmethod
+    @asynccontextmanager
+    async def _get_tcp_km(cls, config_culling=False):
+        if config_culling or asyncio.get_event_loop() is not cls._class_loop:
+            # Culling needs its own config, and lifecycles run in other
+            # threads/processes have their own loop: use a throwaway manager.
+            km = cls._make_km(config_culling)
+            try:
+                await km.warm_task
+                yield km
+            finally:
+                await km.shutdown_all()
+            return
+
+        km = cls._shared_km
+        if km is None:
+            km = cls._shared_km = cls._make_km()
+            try:
+                await km.warm_task
+            except Exception as e:
+                if not isinstance(e, MaximumKernelsException):
+                    km.log.exception("Kernel failed starting up")
+        # Cheap when the pool is already warm; also recovers after a test
+        # that calls shutdown_all() on the shared manager:
+        await settle_pool(km)
+        km.fill_if_needed(delay=0)
+        await settle_pool(km)
         try:
-            await km.wait_for_pool()
             yield km
         finally:
-            await km.shutdown_all()
+            # Only shut down the kernels this test started (anything live
+            # that is not in the pool), and leave nothing pending on the
+            # shared loop between tests:
+            pooled = await settle_pool(km)
+            for kid in set(km.list_kernel_ids()) - pooled:
+                await km.shutdown_kernel(kid, now=True)
+            km.fill_if_needed(delay=0)
+            await settle_pool(km)
+            try:
+                await asyncio.gather(*km._discarded)
+            except Exception as e:
+                if not isinstance(e, MaximumKernelsException):
+                    km.log.exception("Kernel failed starting up")
+            km._discarded = []
 
     # Mapping manager doesn't handle this:
     @mark.skip()
@@ -80,51 +162,56 @@ class TestMappingKernelManagerApplied(TestAsyncKernelManager):
     async def test_tcp_lifecycle_with_kernel_id(self):
         pass
 
-    @gen_test(timeout=60)
+    @gen_test(timeout=TEST_TIMEOUT)
     async def test_exceed_pool_size(self):
         async with self._get_tcp_km() as km:
             self.assertEqual(len(km._pools[NATIVE_KERNEL_NAME]), 2)
-            kids = []
-            for i in range(4):
-                kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            # Kernel startup is I/O bound, so start them concurrently:
+            kids = list(await asyncio.wait_for(
+                asyncio.gather(*(km.start_kernel(**_QUIET) for i in range(4))),
+                START_TIMEOUT,
+            ))
+            for kid in kids:
                 self.assertIn(kid, km)
-                kids.append(kid)
-                self.assertEqual(len(km._pools[NATIVE_KERNEL_NAME]), 2)
+            self.assertEqual(len(km._pools[NATIVE_KERNEL_NAME]), 2)
 
             await async_shutdown_all_direct(km)
             for kid in kids:
                 self.assertNotIn(kid, km)
 
             # Cycle again to assure the pool survives that
-            kids = []
-            for i in range(4):
-                kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            kids = list(await asyncio.wait_for(
+                asyncio.gather(*(km.start_kernel(**_QUIET) for i in range(4))),
+                START_TIMEOUT,
+            ))
+            for kid in kids:
                 self.assertIn(kid, km)
-                kids.append(kid)
-                self.assertEqual(len(km._pools[NATIVE_KERNEL_NAME]), 2)
+            self.assertEqual(len(km._pools[NATIVE_KERNEL_NAME]), 2)
 
             await km.shutdown_all()
             for kid in kids:
                 self.assertNotIn(kid, km)
 
-    @gen_test(timeout=60)
+    @gen_test(timeout=TEST_TIMEOUT)
     async def test_breach_max(self):
         async with self._get_tcp_km() as km:
-            kids = []
-            for i in range(4):
-                kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            kids = list(await asyncio.wait_for(
+                asyncio.gather(*(km.start_kernel(**_QUIET) for i in range(4))),
+                START_TIMEOUT,
+            ))
+            for kid in kids:
                 self.assertIn(kid, km)
-                kids.append(kid)
 
             with self.assertRaises(MaximumKernelsException):
-                await km.start_kernel(stdout=PIPE, stderr=PIPE)
+                await km.start_kernel(**_QUIET)
 
             # Remove and add one to make sure we correctly recovered
+            kid = kids[-1]
             await km.shutdown_kernel(kid)
             self.assertNotIn(kid, km)
             kids.pop()
 
-            kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            kid = await km.start_kernel(**_QUIET)
             self.assertIn(kid, km)
             kids.append(kid)
 
@@ -132,7 +219,7 @@ class TestMappingKernelManagerApplied(TestAsyncKernelManager):
             for kid in kids:
                 self.assertNotIn(kid, km)
 
-    @gen_test(timeout=60)
+    @gen_test(timeout=TEST_TIMEOUT + 2 * (CULL_TIMEOUT + CULL_INTERVAL))
     async def test_culling(self):
         # this will start and await the pool:
         async with self._get_tcp_km(config_culling=True) as km:
@@ -145,22 +232,12 @@ class TestMappingKernelManagerApplied(TestAsyncKernelManager):
             assert not culled
 
             # pop one kernel
-            kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            kid = await km.start_kernel(**_QUIET)
 
             culled = await self.get_cull_status(km, kid)  # now active, should be culled
             assert culled
 
 
     async def get_cull_status(self, km, kid):
-        frequency = 0.5
-        culled = False
-        for _ in range(int((CULL_TIMEOUT + CULL_INTERVAL)/frequency)):  # Timeout + Interval will ensure cull
-            try:
-                km.get_kernel(kid)
-            except HTTPError as e:
-                assert e.status_code == 404
-                culled = True
-                break
-            else:
-                await asyncio.sleep(frequency)
-        return culled
+        # Timeout + interval will ensure cull
+        return await wait_for_cull(km, kid, CULL_TIMEOUT + CULL_INTERVAL)
@@ -1,6 +1,5 @@
 import asyncio
 from contextlib import asynccontextmanager
-from subprocess import PIPE
 from unittest import TestCase
 
 from jupyter_client.kernelspec import NATIVE_KERNEL_NAME
@@ -16,7 +15,13 @@ try:
 except ImportError:
     pass
 
-from .utils import async_shutdown_all_direct, TestAsyncKernelManager
+from .utils import (
+    _QUIET,
+    START_TIMEOUT,
+    TEST_TIMEOUT,
+    async_shutdown_all_direct,
+    TestAsyncKernelManager,
+)
 
 # Test that it works as normal with default config
 class TestPooledKernelManagerUnused(TestAsyncKernelManager):
@@ -26,8 +31,8 @@ class TestPooledKernelManagerUnused(TestAsyncKernelManager):
     @staticmethod
     @asynccontextmanager
     async def _get_tcp_km():
-        c = Config()
-        km = PooledKernelManager(config=c)
+        # No config overrides apply here, so skip building a Config:
+        km = PooledKernelManager()
         try:
             yield km
         finally:
@@ -46,7 +51,7 @@ class TestPooledKernelManagerApplied(TestAsyncKernelManager):
         c.LimitedKernelManager.max_kernels = 4
         c.PooledKernelManager.fill_delay = 0
         c.PooledKernelManager.kernel_pools = {NATIVE_KERNEL_NAME: 2}
-        c.PooledKernelManager.pool_kwargs = {NATIVE_KERNEL_NAME: dict(stdout=PIPE, stderr=PIPE)}
+        c.PooledKernelManager.pool_kwargs = {NATIVE_KERNEL_NAME: dict(_QUIET)}
         km = PooledKernelManager(config=c)
         try:
             await km.wait_for_pool()
@@ -54,26 +59,29 @@ class TestPooledKernelManagerApplied(TestAsyncKernelManager):
         finally:
             await km.shutdown_all()
 
-    @gen_test(timeout=60)
+    @gen_test(timeout=TEST_TIMEOUT)
     async def test_exceed_pool_size(self):
         async with self._get_tcp_km() as km:
             self.assertEqual(len(km._pools[NATIVE_KERNEL_NAME]), 2)
-            kids = []
-            for i in range(4):
-                kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            # Kernel startup is I/O bound, so start them concurrently:
+            kids = list(await asyncio.wait_for(
+                asyncio.gather(*(km.start_kernel(**_QUIET) for i in range(4))),
+                START_TIMEOUT,
+            ))
+            for kid in kids:
                 self.assertIn(kid, km)
-                kids.append(kid)
 
             await async_shutdown_all_direct(km)
             for kid in kids:
                 self.assertNotIn(kid, km)
 
             # Cycle again to assure the pool survives that
-            kids = []
-            for i in range(4):
-                kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            kids = list(await asyncio.wait_for(
+                asyncio.gather(*(km.start_kernel(**_QUIET) for i in range(4))),
+                START_TIMEOUT,
+            ))
+            for kid in kids:
                 self.assertIn(kid, km)
-                kids.append(kid)
 
             await km.shutdown_all()
             for kid in kids:
@@ -93,24 +101,26 @@ class TestPooledKernelManagerApplied(TestAsyncKernelManager):
             km.kernel_pools = {NATIVE_KERNEL_NAME: 3}
             self.assertEqual(len(km._pools[NATIVE_KERNEL_NAME]), 3)
 
-    @gen_test(timeout=60)
+    @gen_test(timeout=TEST_TIMEOUT)
     async def test_breach_max(self):
         async with self._get_tcp_km() as km:
-            kids = []
-            for i in range(4):
-                kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            kids = list(await asyncio.wait_for(
+                asyncio.gather(*(km.start_kernel(**_QUIET) for i in range(4))),
+                START_TIMEOUT,
+            ))
+            for kid in kids:
                 self.assertIn(kid, km)
-                kids.append(kid)
 
             with self.assertRaises(MaximumKernelsException):
-                await km.start_kernel(stdout=PIPE, stderr=PIPE)
+                await km.start_kernel(**_QUIET)
 
             # Remove and add one to make sure we correctly recovered
+            kid = kids[-1]
             await km.shutdown_kernel(kid)
             self.assertNotIn(kid, km)
             kids.pop()
 
-            kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            kid = await km.start_kernel(**_QUIET)
             self.assertIn(kid, km)
             kids.append(kid)
 
@@ -131,7 +141,7 @@ class TestPooledKernelManagerStrict(AsyncTestCase):
         km = PooledKernelManager(config=c)
 
         try:
-            kid = await km.start_kernel(kernel_name=NATIVE_KERNEL_NAME, stdout=PIPE, stderr=PIPE)
+            kid = await km.start_kernel(kernel_name=NATIVE_KERNEL_NAME, **_QUIET)
             self.assertIn(kid, km)
 
         finally:
@@ -147,7 +157,7 @@ class TestPooledKernelManagerStrict(AsyncTestCase):
 
         try:
             with self.assertRaisesRegex(ValueError, "Cannot start kernel with name"):
-                kid = await km.start_kernel(kernel_name="foo", stdout=PIPE, stderr=PIPE)
+                kid = await km.start_kernel(kernel_name="foo", **_QUIET)
             self.assertEqual(len(km._pools[NATIVE_KERNEL_NAME]), 1)
         finally:
             await km.shutdown_all()
@@ -156,12 +166,12 @@ class TestPooledKernelManagerStrict(AsyncTestCase):
     async def test_strict_kwargs_correct(self):
         c = Config()
         c.PooledKernelManager.kernel_pools = {NATIVE_KERNEL_NAME: 1}
-        c.PooledKernelManager.pool_kwargs = {NATIVE_KERNEL_NAME: dict(stdout=PIPE, stderr=PIPE)}
+        c.PooledKernelManager.pool_kwargs = {NATIVE_KERNEL_NAME: dict(_QUIET)}
         c.PooledKernelManager.strict_pool_kwargs = True
         km = PooledKernelManager(config=c)
 
         try:
-            kid = await km.start_kernel(stdout=PIPE, stderr=PIPE)
+            kid = await km.start_kernel(**_QUIET)
             self.assertIn(kid, km)
         finally:
             await km.shutdown_all()
@@ -171,7 +181,7 @@ class TestPooledKernelManagerStrict(AsyncTestCase):
     async def test_strict_kwargs_incorrect(self):
         c = Config()
         c.PooledKernelManager.kernel_pools = {NATIVE_KERNEL_NAME: 1}
-        c.PooledKernelManager.pool_kwargs = {NATIVE_KERNEL_NAME: dict(stdout=PIPE, stderr=PIPE)}
+        c.PooledKernelManager.pool_kwargs = {NATIVE_KERNEL_NAME: dict(_QUIET)}
         c.PooledKernelManager.strict_pool_kwargs = True
         km = PooledKernelManager(config=c)
 
@@ -187,12 +197,12 @@ class TestPooledKernelManagerStrict(AsyncTestCase):
         c = Config()
         c.PooledKernelManager.kernel_pools = {NATIVE_KERNEL_NAME: 1}
         c.PooledKernelManager.strict_pool_names = True
-        c.PooledKernelManager.pool_kwargs = {NATIVE_KERNEL_NAME: dict(stdout=PIPE, stderr=PIPE)}
+        c.PooledKernelManager.pool_kwargs = {NATIVE_KERNEL_NAME: dict(_QUIET)}
         c.PooledKernelManager.strict_pool_kwargs = True
         km = PooledKernelManager(config=c)
 
         try:
-            kid = await km.start_kernel(kernel_name=NATIVE_KERNEL_NAME, stdout=PIPE, stderr=PIPE)
+            kid = await km.start_kernel(kernel_name=NATIVE_KERNEL_NAME, **_QUIET)
             self.assertIn(kid, km)
         finally:
             await km.shutdown_all()
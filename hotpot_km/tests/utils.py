@@ -1,10 +1,12 @@
 import asyncio
-import threading
+import functools
+import os
+import sys
 import uuid
 import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 
-import pytest
-from subprocess import PIPE
+from subprocess import DEVNULL
 from tornado.testing import AsyncTestCase, gen_test
 from unittest import TestCase
 
@@ -13,6 +15,7 @@ from jupyter_client.ioloop import IOLoopKernelManager
 from jupyter_client.localinterfaces import localhost
 
 from ..async_utils import ensure_async
+from ..limited import MaximumKernelsException
 
 try:
     from jupyter_client import AsyncKernelManager
@@ -20,25 +23,114 @@ except ImportError:
     pass
 
 
+# The tests never assert on captured kernel output, so discard it instead of
+# accumulating it in pipe buffers (which can stall the kernel once full):
+_QUIET = dict(stdout=DEVNULL, stderr=DEVNULL)
+
+# localhost() can hit the resolver, and its answer never changes mid-run:
+_localhost = functools.lru_cache(maxsize=1)(localhost)
+
+# Tight budgets bound the cost of a hung kernel to seconds instead of a
+# minute per test; loosen via the env var for genuinely slow machines:
+TEST_TIMEOUT = float(os.environ.get("HOTPOT_TEST_TIMEOUT", "15"))
+# Budget for a batch of kernel starts within a test:
+START_TIMEOUT = 5
+
+if sys.platform != "win32":
+    # Fork worker processes from a forkserver with the expensive imports
+    # already hot, instead of forking the test process itself (which holds
+    # threads and a running event loop):
+    _MP = mp.get_context("forkserver")
+    _MP.set_forkserver_preload(["jupyter_client", "hotpot_km.tests.utils"])
+else:
+    _MP = mp.get_context("spawn")
+
+
 async def async_shutdown_all_direct(km):
+    # Shut down concurrently and forcibly, so the wall time is bounded by
+    # the slowest kernel instead of the sum:
     kids = km.list_kernel_ids()
-    futs = []
-    for kid in kids:
-        await ensure_async(km.shutdown_kernel(kid))
+    await asyncio.gather(
+        *(ensure_async(km.shutdown_kernel(kid, now=True)) for kid in kids)
+    )
+
+
+async def settle_pool(km):
+    """Wait for all pool entries to finish starting up, discarding failures.
+
+    Returns the set of kernel ids currently held by the pool.
+    """
+    pooled = set()
+    for pool in km._pools.values():
+        for fut in tuple(pool):
+            try:
+                pooled.add(await fut)
+            except Exception as e:
+                if not isinstance(e, MaximumKernelsException):
+                    km.log.exception("Kernel failed starting up")
+                try:
+                    pool.remove(fut)
+                except ValueError:
+                    pass
+    return pooled
+
+
+async def wait_for_cull(km, kid, timeout):
+    """Wait for the manager to remove the given kernel, without polling.
+
+    Hooks the manager's `remove_kernel` call and waits on an event, so this
+    returns as soon as the removal actually happens, with `timeout` only as
+    a safety net. Returns whether the kernel was removed within the timeout.
+    """
+    evt = asyncio.Event()
+    inner_remove_kernel = km.remove_kernel
+
+    def remove_kernel(kernel_id, *args, **kwargs):
+        if kernel_id == kid:
+            evt.set()
+        return inner_remove_kernel(kernel_id, *args, **kwargs)
+
+    km.remove_kernel = remove_kernel
+    try:
+        if kid not in km:
+            return True
+        try:
+            await asyncio.wait_for(evt.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+    finally:
+        km.remove_kernel = inner_remove_kernel
 
 
 class TestAsyncKernelManager(AsyncTestCase):
     # Prevent the base class from being collected directly
     __test__ = False
 
+    # Cached per class, so the process startup cost is only paid once:
+    _proc_pool = None
+
+    @classmethod
+    def _get_proc_pool(cls):
+        if cls._proc_pool is None:
+            cls._proc_pool = ProcessPoolExecutor(max_workers=1, mp_context=_MP)
+        return cls._proc_pool
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._proc_pool is not None:
+            cls._proc_pool.shutdown()
+            cls._proc_pool = None
+        super().tearDownClass()
+
     # static so picklable for multiprocessing on Windows
     @staticmethod
     async def _run_lifecycle(km, test_kid=None):
         if test_kid:
-            kid = await ensure_async(km.start_kernel(stdout=PIPE, stderr=PIPE, kernel_id=test_kid))
+            kid = await ensure_async(km.start_kernel(**_QUIET, kernel_id=test_kid))
             assert kid == test_kid
         else:
-            kid = await ensure_async(km.start_kernel(stdout=PIPE, stderr=PIPE))
+            kid = await ensure_async(km.start_kernel(**_QUIET))
         assert await ensure_async(km.is_alive(kid))
         assert kid in km
         assert kid in km.list_kernel_ids()
@@ -52,7 +144,7 @@ class TestAsyncKernelManager(AsyncTestCase):
         assert kid not in km, f"{kid} not in {km}"
 
     async def _run_cinfo(self, km, transport, ip):
-        kid = await ensure_async(km.start_kernel(stdout=PIPE, stderr=PIPE))
+        kid = await ensure_async(km.start_kernel(**_QUIET))
         k = km.get_kernel(kid)
         cinfo = km.get_connection_info(kid)
         self.assertEqual(transport, cinfo["transport"])
@@ -78,10 +170,10 @@ class TestAsyncKernelManager(AsyncTestCase):
     async def test_tcp_lifecycle_with_kernel_id(self):
         await self.raw_tcp_lifecycle(test_kid=str(uuid.uuid4()))
 
-    @gen_test(timeout=20)
+    @gen_test(timeout=TEST_TIMEOUT)
     async def test_shutdown_all(self):
         async with self._get_tcp_km() as km:
-            kid = await ensure_async(km.start_kernel(stdout=PIPE, stderr=PIPE))
+            kid = await ensure_async(km.start_kernel(**_QUIET))
             self.assertIn(kid, km)
             await ensure_async(km.shutdown_all())
             self.assertNotIn(kid, km)
@@ -91,9 +183,9 @@ class TestAsyncKernelManager(AsyncTestCase):
     @gen_test
     async def test_tcp_cinfo(self):
         async with self._get_tcp_km() as km:
-            await self._run_cinfo(km, "tcp", localhost())
+            await self._run_cinfo(km, "tcp", _localhost())
 
-    @gen_test(timeout=60)
+    @gen_test(timeout=TEST_TIMEOUT)
     async def test_start_sequence_tcp_kernels(self):
         """Ensure that a sequence of kernel startups doesn't break anything."""
         async with self._get_tcp_km() as km:
@@ -129,30 +221,24 @@ class TestAsyncKernelManager(AsyncTestCase):
 
     @gen_test
     async def test_start_parallel_thread_kernels(self):
-        await self.raw_tcp_lifecycle()
+        # Run all three lifecycles concurrently, overlapping the in-loop one
+        # with the ones running on their own loops in worker threads:
+        loop = asyncio.get_event_loop()
+        await asyncio.gather(
+            self.raw_tcp_lifecycle(),
+            loop.run_in_executor(None, self.tcp_lifecycle_with_loop),
+            loop.run_in_executor(None, self.tcp_lifecycle_with_loop),
+        )
 
-        thread = threading.Thread(target=self.tcp_lifecycle_with_loop)
-        thread2 = threading.Thread(target=self.tcp_lifecycle_with_loop)
-        try:
-            thread.start()
-            thread2.start()
-        finally:
-            thread.join()
-            thread2.join()
-
-    @pytest.mark.skipif(mp.get_start_method() == "fork", reason="Fork")
     @gen_test
     async def test_start_parallel_process_kernels(self):
-        await self.raw_tcp_lifecycle()
-
-        thread = threading.Thread(target=self.tcp_lifecycle_with_loop)
-        proc = mp.Process(target=self.tcp_lifecycle_with_loop)
-
-        try:
-            thread.start()
-            proc.start()
-        finally:
-            proc.join()
-            thread.join()
-
-        assert proc.exitcode == 0
+        # As above, but with one lifecycle in a worker process; the executor
+        # propagates any failure in the child (replacing the exitcode check).
+        # The worker never forks the test process itself (see _MP above), so
+        # this is safe even where the default start method is fork:
+        loop = asyncio.get_event_loop()
+        await asyncio.gather(
+            self.raw_tcp_lifecycle(),
+            loop.run_in_executor(None, self.tcp_lifecycle_with_loop),
+            loop.run_in_executor(self._get_proc_pool(), self.tcp_lifecycle_with_loop),
+        )